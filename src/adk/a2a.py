@@ -3,9 +3,23 @@ A2A (Agent-to-Agent) Protocol
 
 Event-based communication protocol for agent coordination.
 No persistence, no chat, synchronous dispatch.
+
+Messages sent from inside a handler are queued and delivered after that
+handler returns, so send chains run iteratively rather than recursively.
+A handler that raises fails only its own message and the messages it sent.
+
+publish() is the fire-and-forget path: it drops a message into the target's
+bounded, lock-protected mailbox (safe from any thread) and flush() later
+delivers the mailbox contents in batches.
 """
 
-from typing import Callable, Dict, List
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from weakref import WeakValueDictionary
+
+# Default number of messages a mailbox holds before publish() starts dropping
+DEFAULT_MAILBOX_CAPACITY = 1024
 
 
 class A2A:
@@ -13,21 +27,31 @@ class A2A:
     In-process event bus for agent-to-agent communication.
     """
     
-    # Class-level registry for cross-agent communication
-    _global_handlers: Dict[str, List[tuple]] = {}
-    _instances: Dict[str, 'A2A'] = {}
+    # Class-level registry for cross-agent communication.
+    # Weak references let discarded agents drop out without explicit cleanup.
+    _instances: "WeakValueDictionary[str, A2A]" = WeakValueDictionary()
     
-    def __init__(self, agent_id: str):
+    # Pending (to_agent, event_type, message) entries and re-entrancy flag for the drain loop
+    _submission_queue: Deque[Tuple[str, str, dict]] = deque()
+    _dispatching = False
+    
+    def __init__(self, agent_id: str, mailbox_capacity: int = DEFAULT_MAILBOX_CAPACITY):
         """
         Initialize A2A instance for an agent.
         
         Args:
             agent_id: Unique identifier for the agent
+            mailbox_capacity: Maximum messages held for publish()/flush()
         """
         self.agent_id = agent_id
         self.handlers: Dict[str, List[Callable]] = {}
         self.running = False
         
+        # Bounded mailbox for published messages awaiting flush()
+        self.mailbox_capacity = mailbox_capacity
+        self._mailbox: Deque[dict] = deque()
+        self._mailbox_lock = threading.Lock()
+        
         # Register this instance globally
         A2A._instances[agent_id] = self
     
@@ -39,49 +63,247 @@ class A2A:
             event_type: Type of event to listen for (e.g., "NEW_TASK")
             handler: Callable to invoke when event is received
         """
-        if event_type not in self.handlers:
-            self.handlers[event_type] = []
+        self.handlers.setdefault(event_type, []).append(handler)
+    
+    @staticmethod
+    def _event_type(message: dict) -> str:
+        """
+        Validate a message and return its event type.
         
-        self.handlers[event_type].append(handler)
+        Args:
+            message: Message dictionary with 'type' field required
+            
+        Returns:
+            Value of the message's 'type' field
+        """
+        # Type check is skipped under python -O; the 'type' lookup still validates
+        if __debug__ and not isinstance(message, dict):
+            raise ValueError("Message must be a dictionary")
         
-        # Register globally with agent_id
-        key = f"{self.agent_id}:{event_type}"
-        if key not in A2A._global_handlers:
-            A2A._global_handlers[key] = []
+        try:
+            return message["type"]
+        except (TypeError, KeyError) as e:
+            raise ValueError("Message must contain 'type' field") from e
+    
+    @staticmethod
+    def _drain(on_error: Optional[Callable[[dict, Exception], None]] = None):
+        """
+        Deliver queued messages until the submission queue is empty.
+        
+        A raising handler fails only its own message: whatever that handler
+        queued is abandoned and delivery continues with the next entry.
+        No-op when a dispatch loop is already running further up the stack.
+        
+        Args:
+            on_error: Called with (message, exception) for each failed
+                delivery; if None, the first failure is raised once the
+                queue has drained
+        """
+        if A2A._dispatching:
+            return
+        
+        # Hoist lookups out of the drain loop
+        queue = A2A._submission_queue
+        instances = A2A._instances
+        popleft = queue.popleft
+        first_error: Optional[Exception] = None
         
-        A2A._global_handlers[key].append((self.agent_id, handler))
+        A2A._dispatching = True
+        try:
+            while queue:
+                target_agent, event_type, pending = popleft()
+                
+                # Look up target agent instance
+                target_instance = instances.get(target_agent)
+                
+                if target_instance is None or not target_instance.running:
+                    continue
+                
+                # Handlers only append, so anything past the mark was queued by this message
+                mark = len(queue)
+                
+                # Dispatch once to target agent's handlers
+                try:
+                    for handler in target_instance.handlers.get(event_type, ()):
+                        handler(pending)
+                except Exception as e:
+                    while len(queue) > mark:
+                        queue.pop()
+                    
+                    if on_error is not None:
+                        on_error(pending, e)
+                    elif first_error is None:
+                        first_error = e
+        except BaseException:
+            # Interrupted (or on_error raised): abandon everything still queued
+            queue.clear()
+            raise
+        finally:
+            A2A._dispatching = False
+        
+        if first_error is not None:
+            raise first_error
     
     def send(self, to_agent: str, message: dict):
         """
         Send a message to another agent.
         
+        The outermost send() drains the submission queue before returning;
+        sends issued by handlers are enqueued and delivered in order. The first
+        handler error is re-raised once the queue has drained.
+        
         Args:
             to_agent: Target agent ID
             message: Message dictionary with 'type' field required
         """
-        if not isinstance(message, dict):
-            raise ValueError("Message must be a dictionary")
+        A2A._submission_queue.append((to_agent, A2A._event_type(message), message))
+        A2A._drain()
+    
+    def send_many(
+        self,
+        to_agent: str,
+        messages: Iterable[dict],
+        on_error: Optional[Callable[[dict, Exception], None]] = None
+    ):
+        """
+        Send a batch of messages to one agent with a single drain.
         
-        if "type" not in message:
-            raise ValueError("Message must contain 'type' field")
+        All messages are validated before any is queued, so a bad message
+        rejects the whole batch. Once queued, a message whose handler raises
+        does not stop delivery of the rest.
         
-        event_type = message["type"]
+        Args:
+            to_agent: Target agent ID
+            messages: Message dictionaries, each with 'type' field required
+            on_error: Called with (message, exception) per failed delivery;
+                if None, the first failure is raised after the batch
+        """
+        event_type = A2A._event_type
+        batch = [(to_agent, event_type(message), message) for message in messages]
+        
+        A2A._submission_queue.extend(batch)
+        A2A._drain(on_error)
+    
+    def broadcast(self, message: dict):
+        """
+        Send a message to every agent that listens for its type.
+        
+        Delivered like send(): queued, then drained by the outermost call.
+        
+        Args:
+            message: Message dictionary with 'type' field required
+        """
+        event_type = A2A._event_type(message)
+        queue = A2A._submission_queue
+        
+        for agent_id, instance in list(A2A._instances.items()):
+            if event_type in instance.handlers:
+                queue.append((agent_id, event_type, message))
+        
+        A2A._drain()
+    
+    def publish(self, to_agent: str, message: dict) -> bool:
+        """
+        Place a message in another agent's mailbox without dispatching it.
+        
+        Safe to call from any thread. Delivery happens on the next flush().
+        
+        Args:
+            to_agent: Target agent ID
+            message: Message dictionary with 'type' field required
+            
+        Returns:
+            True if queued, False if the target is unknown or its mailbox is full
+        """
+        A2A._event_type(message)
         
-        # Look up target agent instance
         target_instance = A2A._instances.get(to_agent)
+        if target_instance is None:
+            return False
         
-        if target_instance and target_instance.running:
-            # Dispatch to target agent's handlers
-            handlers = target_instance.handlers.get(event_type, [])
-            for handler in handlers:
-                handler(message)
+        with target_instance._mailbox_lock:
+            if len(target_instance._mailbox) >= target_instance.mailbox_capacity:
+                return False
+            target_instance._mailbox.append(message)
         
-        # Also check global handlers
-        key = f"{to_agent}:{event_type}"
-        global_handlers = A2A._global_handlers.get(key, [])
-        for agent_id, handler in global_handlers:
-            if agent_id == to_agent:
-                handler(message)
+        return True
+    
+    def get_sender(self, to_agent: str) -> "MailboxSender":
+        """
+        Bind publish() and flush() to one target agent's mailbox.
+        
+        The sender holds the target's mailbox directly, skipping the
+        registry lookup and keyword binding on every call. Its flush()
+        drains that same mailbox even if another instance later registers
+        under the same agent ID.
+        
+        Args:
+            to_agent: Target agent ID
+            
+        Returns:
+            Callable taking a message and returning publish()'s result,
+            with a flush() method for the bound mailbox
+            
+        Raises:
+            ValueError: If the target agent is not registered
+        """
+        target_instance = A2A._instances.get(to_agent)
+        if target_instance is None:
+            raise ValueError(f"Unknown agent: {to_agent}")
+        
+        return MailboxSender(self, to_agent, target_instance)
+    
+    def flush(
+        self,
+        to_agent: str,
+        max_batch: Optional[int] = None,
+        on_error: Optional[Callable[[dict, Exception], None]] = None
+    ) -> int:
+        """
+        Deliver messages waiting in an agent's mailbox.
+        
+        Args:
+            to_agent: Target agent ID
+            max_batch: Maximum messages to deliver; None delivers all
+            on_error: Passed to send_many() for per-message failures
+            
+        Returns:
+            Number of messages taken from the mailbox
+        """
+        target_instance = A2A._instances.get(to_agent)
+        if target_instance is None:
+            return 0
+        
+        return self._flush_mailbox(to_agent, target_instance, max_batch, on_error)
+    
+    def _flush_mailbox(
+        self,
+        to_agent: str,
+        target_instance: "A2A",
+        max_batch: Optional[int],
+        on_error: Optional[Callable[[dict, Exception], None]]
+    ) -> int:
+        """
+        Deliver messages from a specific instance's mailbox.
+        
+        Args:
+            to_agent: Agent ID the messages are addressed to
+            target_instance: Instance whose mailbox is drained
+            max_batch: Maximum messages to deliver; None delivers all
+            on_error: Passed to send_many() for per-message failures
+            
+        Returns:
+            Number of messages taken from the mailbox
+        """
+        mailbox = target_instance._mailbox
+        with target_instance._mailbox_lock:
+            count = len(mailbox) if max_batch is None else min(max_batch, len(mailbox))
+            batch = [mailbox.popleft() for _ in range(count)]
+        
+        if batch:
+            self.send_many(to_agent, batch, on_error)
+        
+        return count
     
     def start(self):
         """
@@ -94,3 +316,63 @@ class A2A:
         Stop listening for messages.
         """
         self.running = False
+
+
+class MailboxSender:
+    """
+    publish() and flush() bound to one agent instance's mailbox.
+    
+    Returned by A2A.get_sender().
+    """
+    
+    __slots__ = ("_bus", "_to_agent", "_target", "_mailbox", "_lock", "_capacity")
+    
+    def __init__(self, bus: A2A, to_agent: str, target_instance: A2A):
+        """
+        Bind to a target instance.
+        
+        Args:
+            bus: Sending agent's A2A instance, used for delivery
+            to_agent: Target agent ID
+            target_instance: Target's A2A instance
+        """
+        self._bus = bus
+        self._to_agent = to_agent
+        self._target = target_instance
+        self._mailbox = target_instance._mailbox
+        self._lock = target_instance._mailbox_lock
+        self._capacity = target_instance.mailbox_capacity
+    
+    def __call__(self, message: dict) -> bool:
+        """
+        Place a message in the bound mailbox without dispatching it.
+        
+        Args:
+            message: Message dictionary with 'type' field required
+            
+        Returns:
+            True if queued, False if the mailbox is full
+        """
+        A2A._event_type(message)
+        with self._lock:
+            if len(self._mailbox) >= self._capacity:
+                return False
+            self._mailbox.append(message)
+        return True
+    
+    def flush(
+        self,
+        max_batch: Optional[int] = None,
+        on_error: Optional[Callable[[dict, Exception], None]] = None
+    ) -> int:
+        """
+        Deliver messages waiting in the bound mailbox.
+        
+        Args:
+            max_batch: Maximum messages to deliver; None delivers all
+            on_error: Passed to send_many() for per-message failures
+            
+        Returns:
+            Number of messages taken from the mailbox
+        """
+        return self._bus._flush_mailbox(self._to_agent, self._target, max_batch, on_error)
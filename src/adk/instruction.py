@@ -4,7 +4,7 @@ Instruction Schema
 Lightweight instruction structure for reasoning agents.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 class Instruction:
@@ -26,41 +26,93 @@ class Instruction:
             goal: What needs to be accomplished
             rules: List of constraints and requirements
         """
-        self.context = context
-        self.goal = goal
-        self.rules = rules or []
+        self._context = context
+        self._goal = goal
+        self._rules = rules or []
+        
+        # Rendered forms, rebuilt lazily after any field is reassigned.
+        # The text also records the rules it was rendered from, so in-place
+        # edits to the rules list invalidate it too.
+        self._text_cache: Optional[str] = None
+        self._text_rules: Tuple[str, ...] = ()
+        self._dict_cache: Optional[dict] = None
+    
+    def _invalidate(self):
+        """Drop memoized renderings."""
+        self._text_cache = None
+        self._dict_cache = None
+    
+    @property
+    def context(self) -> str:
+        """Background information and current state."""
+        return self._context
+    
+    @context.setter
+    def context(self, value: str):
+        self._context = value
+        self._invalidate()
+    
+    @property
+    def goal(self) -> str:
+        """What needs to be accomplished."""
+        return self._goal
+    
+    @goal.setter
+    def goal(self, value: str):
+        self._goal = value
+        self._invalidate()
+    
+    @property
+    def rules(self) -> List[str]:
+        """Constraints and requirements; may be edited in place."""
+        return self._rules
+    
+    @rules.setter
+    def rules(self, value: Optional[List[str]]):
+        self._rules = value or []
+        self._invalidate()
     
     def to_dict(self) -> dict:
         """
         Convert instruction to dictionary.
         
         Returns:
-            Dictionary representation
+            Dictionary representation (memoized; treat as read-only)
         """
-        return {
-            "context": self.context,
-            "goal": self.goal,
-            "rules": self.rules
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "context": self._context,
+                "goal": self._goal,
+                "rules": self._rules
+            }
+        
+        return self._dict_cache
     
     def to_text(self) -> str:
         """
         Convert instruction to text format.
         
         Returns:
-            Text representation
+            Text representation (memoized until a field changes)
         """
+        # Rules are compared by value, since the list may be mutated in place
+        rules = tuple(self._rules)
+        if self._text_cache is not None and rules == self._text_rules:
+            return self._text_cache
+        
         parts = []
         
-        if self.context:
-            parts.append(f"Context:\n{self.context}")
+        if self._context:
+            parts.append(f"Context:\n{self._context}")
         
-        if self.goal:
-            parts.append(f"Goal:\n{self.goal}")
+        if self._goal:
+            parts.append(f"Goal:\n{self._goal}")
         
-        if self.rules:
+        if rules:
             parts.append("Rules:")
-            for rule in self.rules:
+            for rule in rules:
                 parts.append(f"- {rule}")
         
-        return "\n\n".join(parts)
+        self._text_cache = "\n\n".join(parts)
+        self._text_rules = rules
+        return self._text_cache
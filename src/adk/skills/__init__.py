@@ -4,13 +4,14 @@ Skills Package
 Exports all available skills for agents.
 """
 
-from .file_tools import read_file, write_file, delete_file
+from .file_tools import read_file, write_file, append_file, delete_file
 from .task_tools import generate_task_id
 from .a2a_tools import emit_task_complete
 
 __all__ = [
     'read_file',
     'write_file',
+    'append_file',
     'delete_file',
     'generate_task_id',
     'emit_task_complete',
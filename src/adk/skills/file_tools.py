@@ -2,11 +2,30 @@
 File Tools
 
 Filesystem utilities for agent operations.
-UTF-8 encoding, no silent failures, no caching.
+UTF-8 encoding, no silent failures, no content caching.
 """
 
 import os
+import threading
 from pathlib import Path
+from typing import Set
+
+# Parent directories already created (or confirmed) by this process
+_ensured_dirs: Set[str] = set()
+
+
+def _ensure_parent(file_path: Path):
+    """
+    Create the parent directory of a file once per process.
+    
+    Args:
+        file_path: Path of the file about to be written
+    """
+    parent = str(file_path.parent)
+    
+    if parent not in _ensured_dirs:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
 
 
 def read_file(path: str) -> str:
@@ -23,18 +42,37 @@ def read_file(path: str) -> str:
         FileNotFoundError: If file does not exist
         IOError: If read fails
     """
-    file_path = Path(path)
-    
-    if not file_path.exists():
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    # Unbuffered read sized from fstat; bypasses TextIOWrapper setup
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        chunk = os.read(fd, size + 1 if size else 65536)
+        while chunk:
+            chunks.append(chunk)
+            chunk = os.read(fd, 65536)
+    finally:
+        os.close(fd)
+    
+    text = b"".join(chunks).decode('utf-8')
+    
+    # Match text-mode universal newline handling
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    return text
 
 
 def write_file(path: str, content: str):
     """
-    Write content to file.
+    Write content to file atomically.
+    
+    Content is written to a sibling temporary file and moved into place,
+    so readers never observe a partially written file.
     
     Args:
         path: Absolute or relative file path
@@ -45,10 +83,43 @@ def write_file(path: str, content: str):
     """
     file_path = Path(path)
     
+    # Unique per writer, so concurrent writes to one path cannot collide
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    
     # Ensure parent directory exists
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent(file_path)
     
-    with open(file_path, 'w', encoding='utf-8') as f:
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Never leave a partial temporary file behind
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def append_file(path: str, content: str):
+    """
+    Append content to file, creating it if missing.
+    
+    Args:
+        path: Absolute or relative file path
+        content: Content to append
+        
+    Raises:
+        IOError: If write fails
+    """
+    file_path = Path(path)
+    
+    # Ensure parent directory exists
+    _ensure_parent(file_path)
+    
+    with open(file_path, 'a', encoding='utf-8') as f:
         f.write(content)
 
 
@@ -63,9 +134,7 @@ def delete_file(path: str):
         FileNotFoundError: If file does not exist
         IOError: If deletion fails
     """
-    file_path = Path(path)
-    
-    if not file_path.exists():
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {path}")
-    
-    file_path.unlink()
@@ -4,8 +4,10 @@ Task Tools
 Task management utilities.
 """
 
-# In-memory task counter
-_task_counter = 0
+import itertools
+
+# In-memory task counter (next() on itertools.count is atomic under the GIL)
+_task_counter = itertools.count(1)
 
 
 def generate_task_id() -> str:
@@ -15,6 +17,4 @@ def generate_task_id() -> str:
     Returns:
         Task ID in format "TASK-XXX"
     """
-    global _task_counter
-    _task_counter += 1
-    return f"TASK-{_task_counter:03d}"
+    return f"TASK-{next(_task_counter):03d}"
@@ -22,15 +22,78 @@ ARCHITECTURE NOTE:
 """
 
 import os
-from typing import Dict, List, Optional
+import re
+import sys
+from collections import OrderedDict
+from functools import cached_property
+from typing import Dict, Optional
 from pathlib import Path
 
 from adk.agent import Agent
 from adk.a2a import A2A
-from adk.skills.file_tools import read_file, write_file, delete_file
+from adk.skills.file_tools import read_file, write_file, append_file, delete_file
 from adk.skills.task_tools import generate_task_id
 
 
+# Roster grammar, one alternative per meaningful line: "## agent_id" headers,
+# "- item" entries, and any other line with a colon (a potential section header).
+# Anchored on the preceding newline so the scan can skip ahead between lines.
+_ROSTER_LINE_RE = re.compile(
+    r'\n[^\S\n]*(?:(##(?!#)[^\n]*)|(-[^\n]*)|([^\n]*:[^\n]*))(?![^\n])'
+)
+
+# Finished task IDs remembered for duplicate TASK_COMPLETE detection
+_RECENT_COMPLETIONS_LIMIT = 4096
+
+# Metadata separator plus spec body, as appended to active_spec.md
+_SPEC_ENTRY_TEMPLATE = "\n\n---\n## Task: {task_id} (by {agent_id})\n\n{content}\n"
+
+# System instruction for the Librarian agent
+_LIBRARIAN_SYSTEM_INSTRUCTION = sys.intern("""You are the Librarian agent.
+
+Your role is COORDINATION and STATE CONSOLIDATION, not reasoning.
+
+Your responsibilities:
+1. Receive tasks via A2A protocol
+2. Route tasks to appropriate agents based on capabilities
+3. Track task completion
+4. Collect and consolidate spec files
+5. Maintain active_spec.md as single source of truth
+
+You do NOT:
+- Generate specs yourself
+- Execute domain reasoning
+- Modify source code
+
+You ONLY route, collect, and consolidate.
+
+Follow the Engineering OS rules strictly.
+All state is file-based.
+Communication is event-based via A2A protocol only.
+""")
+
+
+class _TaskState:
+    """
+    Tracking record for a task handled by the Librarian.
+    """
+    
+    __slots__ = ("task_id", "payload", "status", "assigned_agent")
+    
+    def __init__(self, task_id: str, payload: str):
+        """
+        Initialize task state in the "routing" status.
+        
+        Args:
+            task_id: Task identifier
+            payload: Task description/payload
+        """
+        self.task_id = task_id
+        self.payload = payload
+        self.status = "routing"
+        self.assigned_agent: Optional[str] = None
+
+
 class LibrarianAgent(Agent):
     """
     Coordination agent that routes tasks and consolidates specs.
@@ -43,30 +106,29 @@ class LibrarianAgent(Agent):
         Args:
             workspace_root: Absolute path to the ALIVE workspace
         """
-        # Load OS and Roster to determine identity
+        # OS, roster, identity and routing tables load lazily on first access
         self.workspace_root = Path(workspace_root)
         self.os_path = self.workspace_root / "docs" / "engineering_os.md"
         self.roster_path = self.workspace_root / "docs" / "agent_roster.md"
         self.logs_path = self.workspace_root / "logs"
         self.active_spec_path = self.logs_path / "active_spec.md"
         
-        # Load configuration files
-        self.os_content = self._load_os()
-        self.roster = self._load_roster()
-        
-        # Resolve own identity from roster
-        self.identity = self._resolve_identity()
+        # String forms for the per-completion file operations
+        self._logs_dir = str(self.logs_path)
+        self._active_spec_str = str(self.active_spec_path)
         
         # Initialize base agent with system instruction
-        system_instruction = self._build_system_instruction()
         super().__init__(
             agent_id="librarian",
-            system_instruction=system_instruction
+            system_instruction=_LIBRARIAN_SYSTEM_INSTRUCTION
         )
         
         # Task tracking (in-memory, non-persistent)
-        self.active_tasks: Dict[str, dict] = {}  # task_id -> task_info
-        self.completion_queue: List[dict] = []  # completed tasks awaiting consolidation
+        self.active_tasks: Dict[str, _TaskState] = {}  # task_id -> task_info
+        self.completion_queue: Dict[str, dict] = {}  # task_id -> completed task awaiting consolidation
+        
+        # Recently finished task IDs, oldest first; outlives active_tasks so late duplicates are caught
+        self._recent_completions: "OrderedDict[str, None]" = OrderedDict()
         
         # Initialize A2A protocol
         self.a2a = A2A(agent_id=self.agent_id)
@@ -74,6 +136,29 @@ class LibrarianAgent(Agent):
         # Register A2A message listeners
         self._register_listeners()
         
+        # Create active_spec.md once so consolidation is append-only
+        self._ensure_active_spec_header()
+        
+    @cached_property
+    def os_content(self) -> str:
+        """Engineering OS document, read on first access."""
+        return self._load_os()
+    
+    @cached_property
+    def roster(self) -> dict:
+        """Parsed agent roster, read on first access."""
+        return self._load_roster()
+    
+    @cached_property
+    def identity(self) -> dict:
+        """Librarian identity resolved from the roster."""
+        return self._resolve_identity()
+    
+    @cached_property
+    def _capability_index(self) -> Dict[str, str]:
+        """Normalized capability -> agent_id routing table."""
+        return self._build_capability_index()
+    
     def _load_os(self) -> str:
         """Load the engineering OS document."""
         if not self.os_path.exists():
@@ -99,17 +184,16 @@ class LibrarianAgent(Agent):
         roster_content = read_file(str(self.roster_path))
         agents = {}
         
-        # Parse YAML-like format in Markdown
-        lines = roster_content.split('\n')
         current_agent = None
         current_section = None
         
-        for line in lines:
-            stripped = line.strip()
-            
+        # Single pass over the meaningful lines; a section stays open until
+        # the next section header (even across agents), as in the original
+        # line-by-line parser
+        for header, item, section in _ROSTER_LINE_RE.findall("\n" + roster_content):
             # Agent header: ## agent_id
-            if stripped.startswith('##') and not stripped.startswith('###'):
-                current_agent = stripped[2:].strip()
+            if header:
+                current_agent = sys.intern(header[2:].strip())
                 if current_agent:
                     agents[current_agent] = {
                         'agent_id': current_agent,
@@ -118,22 +202,44 @@ class LibrarianAgent(Agent):
                     }
                 continue
             
-            # Section header: capabilities: or permissions:
-            if current_agent and ':' in stripped and not stripped.startswith('-'):
-                if 'capabilities' in stripped.lower():
+            if not current_agent:
+                continue
+            
+            # Section header: any line with "capabilities"/"permissions" and a colon
+            if section:
+                section = section.lower()
+                if 'capabilities' in section:
                     current_section = 'capabilities'
-                elif 'permissions' in stripped.lower():
+                elif 'permissions' in section:
                     current_section = 'permissions'
                 continue
             
             # List item: - item
-            if current_agent and current_section and stripped.startswith('-'):
-                item = stripped[1:].strip()
+            if current_section:
+                item = item[1:].strip()
                 if item:
                     agents[current_agent][current_section].append(item)
         
         return agents
     
+    def _build_capability_index(self) -> Dict[str, str]:
+        """
+        Map each normalized capability to the agent that owns it.
+        
+        Returns:
+            Capability -> agent_id in roster order, excluding the Librarian
+            itself; the first agent listing a capability owns it
+        """
+        index: Dict[str, str] = {}
+        for agent_id, agent_info in self.roster.items():
+            if agent_id == "librarian":
+                continue  # Skip self
+            
+            for capability in agent_info.get('capabilities', []):
+                index.setdefault(sys.intern(capability.strip().lower()), agent_id)
+        
+        return index
+    
     def _resolve_identity(self) -> dict:
         """
         Resolve the Librarian's identity from the roster.
@@ -150,36 +256,6 @@ class LibrarianAgent(Agent):
             'role': 'coordinator'
         }
     
-    def _build_system_instruction(self) -> str:
-        """
-        Build the system instruction for the Librarian agent.
-        
-        Returns:
-            System instruction string
-        """
-        return """You are the Librarian agent.
-
-Your role is COORDINATION and STATE CONSOLIDATION, not reasoning.
-
-Your responsibilities:
-1. Receive tasks via A2A protocol
-2. Route tasks to appropriate agents based on capabilities
-3. Track task completion
-4. Collect and consolidate spec files
-5. Maintain active_spec.md as single source of truth
-
-You do NOT:
-- Generate specs yourself
-- Execute domain reasoning
-- Modify source code
-
-You ONLY route, collect, and consolidate.
-
-Follow the Engineering OS rules strictly.
-All state is file-based.
-Communication is event-based via A2A protocol only.
-"""
-    
     def _register_listeners(self):
         """Register A2A message listeners."""
         self.a2a.on("NEW_TASK", self._handle_new_task)
@@ -204,19 +280,15 @@ Communication is event-based via A2A protocol only.
             task_id = generate_task_id()
         
         # Store task in active tracking
-        self.active_tasks[task_id] = {
-            "task_id": task_id,
-            "payload": payload,
-            "status": "routing",
-            "assigned_agent": None
-        }
+        task = _TaskState(task_id, payload)
+        self.active_tasks[task_id] = task
         
         # Route task to appropriate agent
         target_agent = self._route_task(payload)
         
         # Update task tracking
-        self.active_tasks[task_id]["assigned_agent"] = target_agent
-        self.active_tasks[task_id]["status"] = "delegated"
+        task.assigned_agent = target_agent
+        task.status = "delegated"
         
         # Send delegated task via A2A
         self.a2a.send(
@@ -227,6 +299,8 @@ Communication is event-based via A2A protocol only.
                 "payload": payload
             }
         )
+        
+        self._publish_status()
     
     def _route_task(self, payload: str) -> str:
         """
@@ -240,15 +314,10 @@ Communication is event-based via A2A protocol only.
         """
         payload_lower = payload.lower()
         
-        # Match against agent capabilities in roster
-        for agent_id, agent_info in self.roster.items():
-            if agent_id == "librarian":
-                continue  # Skip self
-            
-            capabilities = agent_info.get('capabilities', [])
-            for capability in capabilities:
-                if capability.strip().lower() in payload_lower:
-                    return agent_id
+        # Match against precomputed capability index, in roster order
+        for capability, agent_id in self._capability_index.items():
+            if capability in payload_lower:
+                return agent_id
         
         # Fallback: return librarian (self) if no match
         return "librarian"
@@ -271,21 +340,26 @@ Communication is event-based via A2A protocol only.
         if not agent_id or not task_id:
             return
         
+        # Already consolidated (duplicate protection, O(1) on the recent-completions set)
+        if task_id in self._recent_completions:
+            return
+        
         # Check if task exists and is not already completed (duplicate protection)
-        if task_id in self.active_tasks:
-            if self.active_tasks[task_id].get("status") == "completed":
+        task = self.active_tasks.get(task_id)
+        if task is not None:
+            if task.status == "completed":
                 # Duplicate TASK_COMPLETE - ignore
                 return
-            self.active_tasks[task_id]["status"] = "completed"
+            task.status = "completed"
         else:
             # Unknown task - may be from restart, proceed with spec collection anyway
             pass
         
         # Add to completion queue for spec collection
-        self.completion_queue.append({
+        self.completion_queue[task_id] = {
             "agent_id": agent_id,
             "task_id": task_id
-        })
+        }
         
         # Process spec collection
         self._collect_and_consolidate_spec(agent_id, task_id)
@@ -306,16 +380,15 @@ Communication is event-based via A2A protocol only.
             task_id: ID of the completed task
         """
         # Step 1: Read temporary spec file
-        spec_filename = f"{agent_id}_{task_id}_spec.md"
-        spec_path = self.logs_path / spec_filename
+        spec_path = os.path.join(self._logs_dir, f"{agent_id}_{task_id}_spec.md")
         
-        if not spec_path.exists():
+        if not os.path.exists(spec_path):
             # No spec file found - task may not have generated one
             self._cleanup_task(task_id)
             return
         
         try:
-            spec_content = read_file(str(spec_path))
+            spec_content = read_file(spec_path)
         except Exception:
             # File read error - skip this spec
             self._cleanup_task(task_id)
@@ -324,7 +397,7 @@ Communication is event-based via A2A protocol only.
         if not spec_content.strip():
             # Empty spec file - nothing to consolidate
             try:
-                delete_file(str(spec_path))
+                delete_file(spec_path)
             except Exception:
                 pass  # Deletion failure is non-critical
             self._cleanup_task(task_id)
@@ -334,7 +407,9 @@ Communication is event-based via A2A protocol only.
         try:
             self._append_to_active_spec(spec_content, agent_id, task_id)
         except Exception:
-            # Append failure - do not delete spec file, allow retry
+            # Append failure - do not delete spec file, allow retry; drop the
+            # queue entry so a retried TASK_COMPLETE is not taken for a duplicate
+            self.completion_queue.pop(task_id, None)
             return
         
         # Step 3: Verify content exists in active_spec.md
@@ -343,13 +418,19 @@ Communication is event-based via A2A protocol only.
         # Step 4: Delete temporary spec file only if verification succeeds
         if verification_success:
             try:
-                delete_file(str(spec_path))
+                delete_file(spec_path)
             except Exception:
                 pass  # Deletion failure is non-critical if content is consolidated
         
         # Step 5: Update task state
         self._cleanup_task(task_id)
     
+    def _ensure_active_spec_header(self):
+        """Create active_spec.md with its header if it does not exist."""
+        self.logs_path.mkdir(parents=True, exist_ok=True)
+        if not os.path.exists(self._active_spec_str):
+            write_file(self._active_spec_str, "# Active Specification\n\n")
+    
     def _append_to_active_spec(self, content: str, agent_id: str, task_id: str):
         """
         Append spec content to active_spec.md.
@@ -359,39 +440,41 @@ Communication is event-based via A2A protocol only.
             agent_id: Agent that generated the spec
             task_id: Task ID
         """
-        # Ensure logs directory exists
-        self.logs_path.mkdir(parents=True, exist_ok=True)
-        
-        # Read existing content or create new file
-        if self.active_spec_path.exists():
-            existing_content = read_file(str(self.active_spec_path))
-        else:
-            existing_content = "# Active Specification\n\n"
-        
-        # Append new content with metadata header
-        separator = f"\n\n---\n## Task: {task_id} (by {agent_id})\n\n"
-        updated_content = existing_content + separator + content + "\n"
-        
-        # Write back to file
-        write_file(str(self.active_spec_path), updated_content)
+        # Append new content with metadata header in a single write
+        entry = _SPEC_ENTRY_TEMPLATE.format(task_id=task_id, agent_id=agent_id, content=content)
+        append_file(self._active_spec_str, entry)
     
     def _verify_consolidation(self, content: str) -> bool:
         """
         Verify that content was successfully appended to active_spec.md.
         
+        Only the tail of the file is read, since appended content always
+        lands at the end.
+        
         Args:
             content: Content that should exist in active_spec.md
             
         Returns:
             True if verification succeeds, False otherwise
         """
-        if not self.active_spec_path.exists():
+        try:
+            size = os.stat(self._active_spec_str).st_size
+        except FileNotFoundError:
             return False
         
-        active_spec_content = read_file(str(self.active_spec_path))
+        # Read the appended entry plus slack for its trailing newline; text-mode
+        # appends may have written each newline as \r\n, so budget for that too
+        tail_len = len(content.encode('utf-8')) + content.count('\n') + 256
+        with open(self._active_spec_str, 'rb') as f:
+            f.seek(max(0, size - tail_len))
+            tail = f.read().decode('utf-8', errors='ignore')
+        
+        # Match text-mode universal newline handling, as read_file() does
+        if '\r' in tail:
+            tail = tail.replace('\r\n', '\n').replace('\r', '\n')
         
-        # Check if content exists in active spec
-        return content.strip() in active_spec_content
+        # Check if content exists at the end of active spec
+        return content.strip() in tail
     
     def _cleanup_task(self, task_id: str):
         """
@@ -405,10 +488,41 @@ Communication is event-based via A2A protocol only.
             del self.active_tasks[task_id]
         
         # Remove from completion queue
-        self.completion_queue = [
-            item for item in self.completion_queue 
-            if item.get("task_id") != task_id
-        ]
+        self.completion_queue.pop(task_id, None)
+        
+        # Remember the ID so duplicate TASK_COMPLETE messages are ignored
+        recent = self._recent_completions
+        recent[task_id] = None
+        if len(recent) > _RECENT_COMPLETIONS_LIMIT:
+            recent.popitem(last=False)
+        
+        self._publish_status()
+    
+    def _publish_status(self):
+        """
+        Broadcast LIBRARIAN_STATUS counters after task state changes.
+        
+        Only the counters are pushed, so each broadcast is O(1); the task ID
+        list is left to get_status() callers that need it.
+        """
+        self.a2a.broadcast({
+            "type": "LIBRARIAN_STATUS",
+            "status": {
+                "active_task_count": len(self.active_tasks),
+                "completion_queue_length": len(self.completion_queue)
+            }
+        })
+    
+    def warmup(self):
+        """
+        Pay one-time routing costs ahead of the first task.
+        
+        Reads and parses the roster, resolves identity, and builds the
+        capability index, all of which otherwise load lazily on the
+        first NEW_TASK.
+        """
+        self.identity
+        self._capability_index
     
     def start(self):
         """
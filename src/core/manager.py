@@ -3,14 +3,77 @@ System Manager
 
 System bootstrapper and entry point for A.L.I.V.E.
 Initializes A2A bus, instantiates agents, and dispatches tasks.
+Lifecycle and submission are asyncio-native; run under a single event loop.
 """
 
+import asyncio
+import os
+import sys
+from collections.abc import Mapping as MappingABC
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional
 
-from adk.a2a import A2A
 from adk.skills.task_tools import generate_task_id
-from agents.librarian import LibrarianAgent
+
+if TYPE_CHECKING:
+    from adk.a2a import MailboxSender
+
+# Default workspace: parent directory of src/, resolved once at import
+_DEFAULT_WORKSPACE = Path(__file__).resolve().parents[2]
+
+# Max NEW_TASK messages delivered per bus call
+_MAX_BATCH = 64
+
+# A2A routing keys and message type, interned so registry lookups compare by identity
+_AGENT_MANAGER = sys.intern("manager")
+_AGENT_LIBRARIAN = sys.intern("librarian")
+_MSG_NEW_TASK = sys.intern("NEW_TASK")
+_MSG_LIBRARIAN_STATUS = sys.intern("LIBRARIAN_STATUS")
+
+# NEW_TASK message skeleton; copying it beats building the dict literal per submit
+_NEW_TASK_TEMPLATE = {"type": _MSG_NEW_TASK, "task_id": None, "payload": None}
+
+
+class _LibrarianStatus(MappingABC):
+    """
+    Librarian status as seen by the Manager.
+    
+    Counters come from the latest LIBRARIAN_STATUS broadcast; the task ID
+    list is only built when read.
+    """
+    
+    __slots__ = ("_librarian", "_counters")
+    
+    _KEYS = ("active_task_count", "completion_queue_length", "active_tasks")
+    
+    def __init__(self, librarian: Any, counters: Mapping[str, int]):
+        """
+        Initialize the status view.
+        
+        Args:
+            librarian: Librarian agent whose task list is read on demand
+            counters: Mapping with active_task_count and completion_queue_length
+        """
+        self._librarian = librarian
+        self._counters = counters
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == "active_tasks":
+            return list(self._librarian.active_tasks)
+        if key in self._KEYS:
+            return self._counters[key]
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
 class Manager:
@@ -18,6 +81,21 @@ class Manager:
     System entry point and bootstrapper.
     """
     
+    __slots__ = (
+        "workspace_root",
+        "a2a",
+        "librarian",
+        "running",
+        "_executor",
+        "_librarian_mailbox",
+        "_wakeup",
+        "_flusher_task",
+        "_status_buf",
+        "_status_view",
+        "_lifecycle_lock",
+        "_lifecycle_loop",
+    )
+    
     def __init__(self, workspace_root: Optional[str] = None):
         """
         Initialize the system manager.
@@ -25,54 +103,160 @@ class Manager:
         Args:
             workspace_root: Absolute path to ALIVE workspace
         """
-        if workspace_root is None:
-            # Default to parent directory of src/
-            workspace_root = Path(__file__).parent.parent.parent
+        # Deferred so importing this module does not pull in the agent stack
+        from adk.a2a import A2A
+        from agents.librarian import LibrarianAgent
         
-        self.workspace_root = Path(workspace_root)
+        self.workspace_root = Path(workspace_root) if workspace_root is not None else _DEFAULT_WORKSPACE
         
         # Initialize A2A bus (class-level singleton)
-        self.a2a = A2A(agent_id="manager")
+        self.a2a = A2A(agent_id=_AGENT_MANAGER)
         
         # Initialize Librarian agent
         self.librarian = LibrarianAgent(str(self.workspace_root))
         
+        # Worker threads for agent start/stop so native work cannot stall the loop
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        
+        # Librarian mailbox publisher/flusher, bound in start()
+        self._librarian_mailbox: Optional["MailboxSender"] = None
+        
+        # Flusher delivering the Librarian's mailbox; woken by submit_task.
+        # Both are created per start() so each event loop gets its own.
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        
+        # Last-known system state, kept current by start/stop and the
+        # Librarian's LIBRARIAN_STATUS broadcasts; exposed read-only
+        self._status_buf = {"running": False, "librarian_status": None}
+        self._status_view = MappingProxyType(self._status_buf)
+        self.a2a.on(_MSG_LIBRARIAN_STATUS, self._on_librarian_status)
+        
+        # Serializes start()/stop(); rebuilt for each event loop
+        self._lifecycle_lock: Optional[asyncio.Lock] = None
+        self._lifecycle_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # System state
         self.running = False
     
-    def start(self):
+    async def start(self):
         """
         Start the A.L.I.V.E system.
-        """
-        # Start A2A bus
-        self.a2a.start()
         
-        # Start Librarian agent
-        self.librarian.start()
+        If already running, only makes sure the flusher runs on the current
+        event loop; concurrent calls wait for the first.
+        """
+        async with self._lifecycle():
+            if self.running:
+                # An earlier loop may have ended without stop(), taking the flusher with it
+                task = self._flusher_task
+                if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+                    self._start_flusher()
+                return
+            
+            # Boot Librarian off-thread (its cold start is the long pole) while the bus starts inline
+            librarian_started = asyncio.get_running_loop().run_in_executor(
+                self._executor, self.librarian.start
+            )
+            self.a2a.start()
+            await librarian_started
+            
+            # Specialize the hot submit path to the Librarian's mailbox
+            self._librarian_mailbox = self.a2a.get_sender(_AGENT_LIBRARIAN)
+            
+            self._start_flusher()
+            
+            self.running = True
+            
+            # Seed the snapshot; later changes arrive as broadcasts
+            self._status_buf["running"] = True
+            self._status_buf["librarian_status"] = _LibrarianStatus(
+                self.librarian, self.librarian.get_status()
+            )
+            
+            # Pre-warm Librarian routing tables in the background; a failure here
+            # simply recurs (and surfaces) on the first task's lazy load
+            self._executor.submit(self.librarian.warmup)
+    
+    def _start_flusher(self):
+        """Start the submission flusher on the current event loop."""
+        self._wakeup = asyncio.Event()
+        self._flusher_task = asyncio.create_task(self._flusher())
         
-        self.running = True
+        # Pick up anything published while no flusher was running
+        self._wakeup.set()
     
-    def stop(self):
+    async def stop(self):
         """
         Stop the A.L.I.V.E system.
+        
+        Queued task submissions are delivered before agents are stopped;
+        agents are stopped even if that delivery fails.
+        No-op if not running; concurrent calls wait for the first.
         """
-        # Stop Librarian agent
-        self.librarian.stop()
+        async with self._lifecycle():
+            if not self.running:
+                return
+            
+            # Flip state first so new submissions bail out
+            self.running = False
+            self._status_buf["running"] = False
+            self._status_buf["librarian_status"] = None
+            
+            try:
+                # Retire the flusher, then deliver anything still in the mailbox
+                if self._flusher_task is not None:
+                    self._flusher_task.cancel()
+                    try:
+                        await self._flusher_task
+                    except asyncio.CancelledError:
+                        pass
+                    self._flusher_task = None
+                
+                self._librarian_mailbox.flush(on_error=self._report_failed_delivery)
+            finally:
+                # Stop Librarian agent off-thread while the bus stops inline
+                librarian_stopped = asyncio.get_running_loop().run_in_executor(
+                    self._executor, self.librarian.stop
+                )
+                self.a2a.stop()
+                await librarian_stopped
+    
+    def _lifecycle(self) -> asyncio.Lock:
+        """
+        Get the lock serializing start() and stop() on the running loop.
         
-        # Stop A2A bus
-        self.a2a.stop()
+        Created per event loop, since an asyncio lock cannot be shared
+        between loops.
         
-        self.running = False
+        Returns:
+            Lifecycle lock for the current loop
+        """
+        loop = asyncio.get_running_loop()
+        
+        if self._lifecycle_loop is not loop:
+            self._lifecycle_lock = asyncio.Lock()
+            self._lifecycle_loop = loop
+        
+        return self._lifecycle_lock
     
-    def submit_task(self, task_description: str) -> str:
+    async def submit_task(self, task_description: str) -> str:
         """
         Submit a task to the system.
         
+        The NEW_TASK message is published to the Librarian's mailbox and
+        delivered by the flusher; this returns without waiting for delivery.
+        A full mailbox is delivered inline first, so submissions never drop.
+        
         Args:
             task_description: Human-readable task description
             
         Returns:
             Generated task ID
+            
+        Raises:
+            RuntimeError: If the system is not running, or the mailbox
+                stays full after being flushed
         """
         if not self.running:
             raise RuntimeError("System is not running. Call start() first.")
@@ -81,49 +265,216 @@ class Manager:
         task_id = generate_task_id()
         
         # Create NEW_TASK message
-        message = {
-            "type": "NEW_TASK",
-            "task_id": task_id,
-            "payload": task_description
-        }
+        message = _NEW_TASK_TEMPLATE.copy()
+        message["task_id"] = task_id
+        message["payload"] = task_description
+        
+        # Publish for batched delivery to Librarian; if the flusher has not
+        # caught up, deliver the backlog inline rather than drop the task
+        while not self._librarian_mailbox(message):
+            if not self._librarian_mailbox.flush(on_error=self._report_failed_delivery):
+                raise RuntimeError(f"Librarian mailbox cannot accept {task_id}")
         
-        # Send to Librarian via A2A
-        self.a2a.send(to_agent="librarian", message=message)
+        self._wakeup.set()
         
         return task_id
     
-    def get_status(self) -> dict:
+    async def flush(self):
+        """
+        Deliver submitted tasks now rather than waiting for the flusher.
+        
+        Await this before reading get_status() to see the effect of the
+        tasks submitted so far. Tasks whose handling fails are reported
+        through the event loop's exception handler, not raised here.
+        """
+        if self._librarian_mailbox is not None:
+            self._librarian_mailbox.flush(on_error=self._report_failed_delivery)
+    
+    async def _flusher(self):
+        """
+        Deliver the Librarian's mailbox in batches whenever tasks arrive.
+        
+        Each batch of up to _MAX_BATCH messages goes out in one bus call,
+        yielding to the event loop between batches.
+        """
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            
+            while self._librarian_mailbox.flush(_MAX_BATCH, on_error=self._report_failed_delivery):
+                await asyncio.sleep(0)
+    
+    def _report_failed_delivery(self, message: dict, error: Exception):
+        """
+        Report a message whose handler raised, without halting delivery.
+        
+        Surfaced through the event loop like an unhandled callback error.
+        
+        Args:
+            message: A2A message that failed
+            error: Exception raised by its handler
+        """
+        asyncio.get_running_loop().call_exception_handler({
+            "message": f"Failed to deliver {message.get('type')} for {message.get('task_id')}",
+            "exception": error,
+        })
+    
+    def _on_librarian_status(self, message: dict):
+        """
+        Record the Librarian's latest status broadcast.
+        
+        Args:
+            message: A2A message with format:
+                {
+                    "type": "LIBRARIAN_STATUS",
+                    "status": {
+                        "active_task_count": int,
+                        "completion_queue_length": int
+                    }
+                }
+        """
+        if self.running:
+            self._status_buf["librarian_status"] = _LibrarianStatus(
+                self.librarian, message.get("status")
+            )
+    
+    def get_status(self) -> Mapping[str, Any]:
         """
         Get system status.
         
+        A pure read of the last-known state; the Librarian pushes changes
+        rather than being polled. Returns a live read-only view, so copy it
+        to keep a snapshot.
+        
         Returns:
-            Dictionary containing system state
+            Mapping containing system state
         """
-        return {
-            "running": self.running,
-            "librarian_status": self.librarian.get_status() if self.running else None
-        }
+        return self._status_view
+
 
+# Process-wide Manager handed out by get_manager()
+_shared_manager: Optional[Manager] = None
 
-def main():
+
+def get_manager(workspace_root: Optional[str] = None) -> Manager:
     """
-    Main entry point for standalone execution.
+    Get the process-wide Manager, constructing it on first use.
+    
+    Repeat callers skip Librarian construction. Agent IDs are global to the
+    A2A registry, so only one workspace is served at a time; asking for a
+    different one replaces the shared instance once it has been stopped.
+    The returned Manager may already be running, possibly started under an
+    earlier event loop; call start() in each loop that uses it, which
+    re-attaches delivery to that loop.
+    
+    Args:
+        workspace_root: Absolute path to ALIVE workspace
+        
+    Returns:
+        Shared Manager instance
+        
+    Raises:
+        RuntimeError: If a Manager for another workspace is still running
     """
-    import sys
+    global _shared_manager
+    
+    root = _DEFAULT_WORKSPACE if workspace_root is None else Path(workspace_root).resolve()
+    
+    if _shared_manager is not None:
+        if _shared_manager.workspace_root == root:
+            return _shared_manager
+        
+        if _shared_manager.running:
+            raise RuntimeError(
+                f"Shared Manager for {_shared_manager.workspace_root} is still running; stop it first"
+            )
     
-    # Initialize manager
-    manager = Manager()
+    _shared_manager = Manager(str(root))
+    return _shared_manager
+
+
+async def _open_stdin_reader() -> Optional[asyncio.StreamReader]:
+    """
+    Attach an asyncio stream reader to stdin.
+    
+    Returns:
+        Reader fed by the event loop, or None where stdin cannot be
+        watched by the loop (regular files, Windows consoles)
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    protocol = asyncio.StreamReaderProtocol(reader)
+    
+    # Hand the transport a duplicate so closing it at EOF leaves sys.stdin open
+    try:
+        pipe = os.fdopen(os.dup(sys.stdin.fileno()), 'rb', buffering=0)
+    except (ValueError, OSError):
+        return None
+    
+    try:
+        await loop.connect_read_pipe(lambda: protocol, pipe)
+    except (ValueError, NotImplementedError, OSError):
+        pipe.close()
+        return None
+    
+    return reader
+
+
+async def _read_line(reader: Optional[asyncio.StreamReader], prompt: str) -> Optional[str]:
+    """
+    Prompt for and read one line without blocking the event loop.
+    
+    Args:
+        reader: Reader from _open_stdin_reader(), or None to read in a thread
+        prompt: Text written before reading
+        
+    Returns:
+        Line without trailing newline, or None at end of input
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    
+    if reader is None:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, input)
+        except EOFError:
+            return None
+    
+    # Already-buffered input (pipes, pastes) returns without suspending;
+    # yield so the flusher and other loop work still get a turn per line
+    await asyncio.sleep(0)
+    
+    line = await reader.readline()
+    if not line:
+        return None
+    
+    return line.decode().rstrip("\r\n")
+
+
+async def main():
+    """
+    Main entry point for standalone execution.
+    """
+    # Initialize (or reuse) the shared manager
+    manager = get_manager()
     
     # Start system
-    manager.start()
+    await manager.start()
     
     print("A.L.I.V.E System Started")
     print("=" * 50)
     
+    # Keyboard input is serviced by the event loop alongside A2A traffic
+    reader = await _open_stdin_reader()
+    
     # Interactive mode
     try:
         while True:
-            task_input = input("\nEnter task (or 'quit' to exit): ").strip()
+            task_input = await _read_line(reader, "\nEnter task (or 'quit' to exit): ")
+            if task_input is None:
+                break
+            
+            task_input = task_input.strip()
             
             if task_input.lower() in ['quit', 'exit', 'q']:
                 break
@@ -132,21 +483,32 @@ def main():
                 continue
             
             # Submit task
-            task_id = manager.submit_task(task_input)
-            print(f"Task submitted: {task_id}")
+            task_id = await manager.submit_task(task_input)
+            
+            # Deliver it before reading status so the count includes it
+            await manager.flush()
             
-            # Show status
+            # Report submission and status in a single write
             status = manager.get_status()
-            print(f"Active tasks: {status['librarian_status']['active_task_count']}")
+            sys.stdout.write(
+                f"Task submitted: {task_id}\n"
+                f"Active tasks: {status['librarian_status']['active_task_count']}\n"
+            )
+            sys.stdout.flush()
     
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # asyncio.run() delivers Ctrl+C as cancellation of this task
         print("\n\nShutting down...")
     
     finally:
+        # The pipe transport made stdin non-blocking; hand it back to the shell as found
+        if reader is not None:
+            os.set_blocking(sys.stdin.fileno(), True)
+        
         # Stop system
-        manager.stop()
+        await manager.stop()
         print("A.L.I.V.E System Stopped")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())